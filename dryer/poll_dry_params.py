@@ -0,0 +1,287 @@
+# Copyright 2024 Enapter
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import struct
+import sys
+import time
+
+from enum import IntEnum
+from typing import Any, Final, Optional, Self
+
+
+# Supported Python version
+MIN_PYTHON_VERSION: Final[tuple[int, int]] = (3, 10)
+
+# Registers addresses
+DRYER_ERRORS_INPUT: Final[int] = 6000
+DRYER_PT00_INPUT: Final[int] = 6010
+DRYER_PT01_INPUT: Final[int] = 6012
+DRYER_STATE_INPUT: Final[int] = 6021
+
+# Number of registers in 6000..6021 input registers window
+DRYER_PARAMS_COUNT: Final[int] = DRYER_STATE_INPUT - DRYER_ERRORS_INPUT + 1
+
+# Raw registers of the window as big-endian uint16 words
+DRYER_PARAMS_WORDS: Final[struct.Struct] = struct.Struct(
+    f'>{DRYER_PARAMS_COUNT}H'
+)
+
+# Layout of the window: errors uint16 (6000), 9 unused registers, PT00 and
+# PT01 float32 (6010, 6012), 7 unused registers, state uint16 (6021)
+DRYER_PARAMS_LAYOUT: Final[struct.Struct] = struct.Struct('>H18x2f14xH')
+
+# Error message usually indicating that DCN is disabled
+SLAVE_DEVICE_FAILURE: Final[str] = 'slave device failure'
+
+
+class DryerError(IntEnum):
+    """
+    Enum values for bitmask of modbus dryer_errors register (6000).
+    """
+    UNKNOWN = -1
+
+    TT00_INVALID_VALUE = 0
+    TT01_INVALID_VALUE = 1
+    TT02_INVALID_VALUE = 2
+    TT03_INVALID_VALUE = 3
+    TT00_VALUE_GROWTH_NOT_ENOUGH = 4
+    TT01_VALUE_GROWTH_NOT_ENOUGH = 5
+    TT02_VALUE_GROWTH_NOT_ENOUGH = 6
+    TT03_VALUE_GROWTH_NOT_ENOUGH = 7
+    PS00_TRIGGERED = 8
+    PS01_TRIGGERED = 9
+    F100_INVALID_RPM = 10
+    F101_INVALID_RPM = 11
+    F102_INVALID_RPM = 12
+    PT00_INVALID_VALUE = 13
+    PT01_INVALID_VALUE = 14
+
+    @classmethod
+    def _missing_(cls, value: Any) -> Self:
+        return cls.UNKNOWN
+
+
+# Human-readable error names indexed by bit number of 16 bits errors bitmask
+DRYER_ERROR_NAMES: Final[tuple[str, ...]] = tuple(
+    DryerError(bit_number).name for bit_number in range(16)
+)
+
+
+class DryerState(IntEnum):
+    """
+    Enum values for dryer state input register (6021).
+    """
+    UNKNOWN = -1
+
+    NONE = 0
+    WAITING_FOR_POWER = 257
+    STOPPED_BY_USER = 259
+    STARTING = 260
+    STANDBY = 262
+    WAITING_FOR_PRESSURE = 263
+    IDLE = 265
+    DRYING_0 = 513
+    COOLING_0 = 514
+    SWITCHING_0 = 515
+    PRESSURIZING_0 = 516
+    FINALIZING_0 = 517
+    DRYING_1 = 769
+    COOLING_1 = 770
+    SWITCHING_1 = 771
+    PRESSURIZING_1 = 772
+    FINALIZING_1 = 773
+    ERROR = 1281
+    BYPASS = 1537
+    BYPASS_1 = 1793
+    BYPASS_2 = 2049
+    MAINTENANCE = 2305
+    EXPERT = 2561
+    FSR_WAIT_BEGIN = 2817
+    FSR_WAIT_CONFIRM = 2818
+    FSR_WAIT_END = 2819
+    FSR_DECLINED = 2820
+    IDCN_WAIT_START = 3073
+    IDCN_WAIT_CONFIRM = 3074
+    IDCN_BEGIN = 3075
+    IDCN_COMMIT = 3076
+    IDCN_COMMIT_ACK = 3077
+    IDCN_WAIT_SYNCED = 3078
+    IDCN_SYNCED = 3079
+    IDCN_DECLINED = 3080
+    IDCN_CANCEL = 3081
+    OTA_FW = 3328
+
+    @classmethod
+    def _missing_(cls, value: Any) -> Self:
+        return cls.UNKNOWN
+
+
+# Human-readable dryer state names by state value
+DRYER_STATE_NAMES: Final[dict[int, str]] = {
+    state.value: state.name for state in DryerState
+}
+
+
+def _positive_float(value: str) -> float:
+    """
+    Convert command line argument to positive float value.
+    """
+    try:
+        converted_value: float = float(value)
+
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'{value} is not a number')
+
+    if not converted_value > 0:
+        raise argparse.ArgumentTypeError(f'{value} is not positive')
+
+    return converted_value
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Polling DRY params with Modbus'
+    )
+
+    parser.add_argument(
+        '--modbus-ip', '-i', help='Modbus IP address', required=True
+    )
+
+    parser.add_argument(
+        '--modbus-port', '-p', help='Modbus port', type=int, default=502
+    )
+
+    parser.add_argument(
+        '--interval', '-t', help='Polling interval in seconds',
+        type=_positive_float, default=1.0
+    )
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    if sys.version_info < MIN_PYTHON_VERSION:
+        raise RuntimeError(
+            f'Python version >='
+            f' {".".join(str(version) for version in MIN_PYTHON_VERSION)} is'
+            f' required'
+        )
+
+    args: argparse.Namespace = parse_args()
+
+    # Import pyModbusTCP only when it's really required, so printing help or
+    # failed version check doesn't spend time on loading it.
+    try:
+        from pyModbusTCP import client
+
+    except ImportError:
+        print(
+            'No pyModbusTCP module installed.\n.'
+            '1. Create virtual environment\n'
+            '2. Run \'pip install pyModbusTCP==0.2.1\''
+        )
+
+        raise
+
+    modbus_client: client.ModbusClient = client.ModbusClient(
+        host=args.modbus_ip, port=args.modbus_port
+    )
+
+    try:
+        # Open TCP connection once, all polling requests share it.
+        if not modbus_client.open():
+            raise RuntimeError(
+                f'Failed to connect to {args.modbus_ip}:{args.modbus_port}'
+            )
+
+        print('Polling dryer params, press Ctrl+C to stop...')
+
+        poll_at: float = time.monotonic()
+
+        # Errors bitmask usually stays the same for many polling cycles, so
+        # it's decoded again only when changed.
+        last_errors: Optional[int] = None
+        decoded_errors: str = ''
+
+        while True:
+            # Read 6000 errors, 6010 and 6012 pressures and 6021 state input
+            # registers with a single request covering 6000..6021 range, so
+            # number of registers to read is 6021 - 6000 + 1 = 22. Only one
+            # network round trip is required per polling cycle.
+            raw_dryer_data: list[int] = modbus_client.read_input_registers(
+                reg_addr=DRYER_ERRORS_INPUT, reg_nb=DRYER_PARAMS_COUNT
+            )
+
+            if raw_dryer_data is None:
+                # Connection is lost or dryer doesn't respond. Client
+                # reconnects automatically on the next request.
+                print(
+                    f'Failed to read dryer params: '
+                    f'{modbus_client.last_error_as_txt}, '
+                    f'{modbus_client.last_except_as_txt}'
+                )
+
+            else:
+                # Pack raw response back to bytes and decode all values with
+                # a single unpack.
+                errors, pt00_pressure, pt01_pressure, dryer_state = (
+                    DRYER_PARAMS_LAYOUT.unpack(
+                        DRYER_PARAMS_WORDS.pack(*raw_dryer_data)
+                    )
+                )
+
+                if errors != last_errors:
+                    decoded_errors = ', '.join(
+                        DRYER_ERROR_NAMES[bit_number]
+                        for bit_number in range(16) if errors >> bit_number & 1
+                    ) or 'no errors'
+
+                    last_errors = errors
+
+                dryer_state_name: str = DRYER_STATE_NAMES.get(
+                    dryer_state, DryerState.UNKNOWN.name
+                )
+
+                print(
+                    f'State: {dryer_state_name}, PT00 pressure in bar:'
+                    f' {pt00_pressure}, PT01 pressure in bar: {pt01_pressure},'
+                    f' errors: {decoded_errors}'
+                )
+
+            # Schedule polls at fixed rate regardless of request duration. If
+            # request took longer than interval, schedule is resynced to the
+            # current time instead of sending missed polls in a burst.
+            poll_at = max(poll_at + args.interval, time.monotonic())
+
+            time.sleep(max(poll_at - time.monotonic(), 0))
+
+    except KeyboardInterrupt:
+        print('Polling stopped by user')
+
+    except Exception as e:
+        # If something went wrong, we can access Modbus error/exception info.
+        print(f'Exception occurred: {e}')
+        print(f'Modbus error: {modbus_client.last_error_as_txt}')
+        print(f'Modbus exception: {modbus_client.last_except_as_txt}')
+
+        if SLAVE_DEVICE_FAILURE in modbus_client.last_except_as_txt:
+            print('Please check that DCN is enabled')
+
+        raise
+
+    finally:
+        modbus_client.close()
+
+
+if __name__ == '__main__':
+    main()
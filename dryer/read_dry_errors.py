@@ -16,18 +16,6 @@ import sys
 from enum import IntEnum
 from typing import Any, Final, Self
 
-try:
-    from pyModbusTCP import client
-
-except ImportError:
-    print(
-        'No pyModbusTCP module installed.\n.'
-        '1. Create virtual environment\n'
-        '2. Run \'pip install pyModbusTCP==0.2.1\''
-    )
-
-    raise
-
 
 # Supported Python version
 MIN_PYTHON_VERSION: Final[tuple[int, int]] = (3, 10)
@@ -66,6 +54,12 @@ class DryerError(IntEnum):
         return cls.UNKNOWN
 
 
+# Human-readable error names indexed by bit number of 16 bits errors bitmask
+DRYER_ERROR_NAMES: Final[tuple[str, ...]] = tuple(
+    DryerError(bit_number).name for bit_number in range(16)
+)
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description='Reading DRY errors with Modbus'
@@ -92,11 +86,31 @@ def main() -> None:
 
     args: argparse.Namespace = parse_args()
 
+    # Import pyModbusTCP only when it's really required, so printing help or
+    # failed version check doesn't spend time on loading it.
+    try:
+        from pyModbusTCP import client
+
+    except ImportError:
+        print(
+            'No pyModbusTCP module installed.\n.'
+            '1. Create virtual environment\n'
+            '2. Run \'pip install pyModbusTCP==0.2.1\''
+        )
+
+        raise
+
     modbus_client: client.ModbusClient = client.ModbusClient(
         host=args.modbus_ip, port=args.modbus_port
     )
 
     try:
+        # Open TCP connection once, all subsequent requests share it.
+        if not modbus_client.open():
+            raise RuntimeError(
+                f'Failed to connect to {args.modbus_ip}:{args.modbus_port}'
+            )
+
         # Read dryer errors input register, address is 6000. Register type is
         # uint16, so number of registers to read is 16 / 16 = 1.
         raw_errors_data: list[int] = modbus_client.read_input_registers(
@@ -106,16 +120,26 @@ def main() -> None:
         print(f'Got raw dryer errors data: {raw_errors_data}')
 
         if errors := raw_errors_data[0]:
-            # Value is not 0, converting int value to bitmask.
+            # Value is not 0. Each set bit N of the bitmask means active error
+            # with value N. Bitmask is printed from the lowest bit to the
+            # highest one, so bit N is N-th character.
             bitmask: str = '{:016b}'.format(errors)[::-1]
 
             print(f'Got dryer errors bitmask: {bitmask}')
 
-            decoded_errors: list[str] = [
-                DryerError(bit_number).name for bit_number in [
-                    index for index, bit in enumerate(bitmask) if int(bit)
-                ]
-            ]
+            # Iterate over set bits only, from the lowest to the highest one.
+            decoded_errors: list[str] = []
+
+            bits: int = errors
+
+            while bits:
+                lowest_bit: int = bits & -bits
+
+                decoded_errors.append(
+                    DRYER_ERROR_NAMES[lowest_bit.bit_length() - 1]
+                )
+
+                bits ^= lowest_bit
 
             print(
                 f'Got decoded errors: {", ".join(decoded_errors)}\nErrors'
@@ -140,6 +164,9 @@ def main() -> None:
 
         raise
 
+    finally:
+        modbus_client.close()
+
 
 if __name__ == '__main__':
     main()
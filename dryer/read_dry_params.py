@@ -10,28 +10,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
+import struct
 import sys
 
 from enum import IntEnum
-from typing import Any, Final, Self
-
-try:
-    from pyModbusTCP import client, utils
-
-except ImportError:
-    print(
-        'No pyModbusTCP module installed.\n.'
-        '1. Create virtual environment\n'
-        '2. Run \'pip install pyModbusTCP==0.2.1\''
-    )
+from typing import TYPE_CHECKING, Any, Final, Self
 
-    raise
+if TYPE_CHECKING:
+    from pyModbusTCP import client
 
 
 # Supported Python version
 MIN_PYTHON_VERSION: Final[tuple[int, int]] = (3, 10)
 
+# Formats to convert two big-endian 16 bits registers to float32 value
+TWO_REGISTERS: Final[struct.Struct] = struct.Struct('>2H')
+FLOAT32: Final[struct.Struct] = struct.Struct('>f')
+
 # Registers addresses
 DRYER_PT00_INPUT: Final[int] = 6010
 DRYER_PT01_INPUT: Final[int] = 6012
@@ -90,6 +88,12 @@ class DryerState(IntEnum):
         return cls.UNKNOWN
 
 
+# Human-readable dryer state names by state value
+DRYER_STATE_NAMES: Final[dict[int, str]] = {
+    state.value: state.name for state in DryerState
+}
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description='Reading DRY params with Modbus'
@@ -125,43 +129,61 @@ def main() -> None:
 
     args: argparse.Namespace = parse_args()
 
+    # Import pyModbusTCP only when it's really required, so printing help or
+    # failed version check doesn't spend time on loading it.
+    try:
+        from pyModbusTCP import client
+
+    except ImportError:
+        print(
+            'No pyModbusTCP module installed.\n.'
+            '1. Create virtual environment\n'
+            '2. Run \'pip install pyModbusTCP==0.2.1\''
+        )
+
+        raise
+
     modbus_client: client.ModbusClient = client.ModbusClient(
         host=args.modbus_ip, port=args.modbus_port
     )
 
     try:
-        # Read dryer state input register, address is 6021. Register type is
-        # uint16, so number of registers to read is 16 / 16 = 1.
-        raw_dryer_state: list[int] = modbus_client.read_input_registers(
-            reg_addr=DRYER_STATE_INPUT, reg_nb=1
+        # Open TCP connection once, all subsequent requests share it.
+        if not modbus_client.open():
+            raise RuntimeError(
+                f'Failed to connect to {args.modbus_ip}:{args.modbus_port}'
+            )
+
+        # Read 6010 and 6012 pressure input registers together with 6021 dryer
+        # state input register. Pressure registers type is float32, so number
+        # of registers to read for each is 32 / 16 = 2. State register type is
+        # uint16, so number of registers to read is 16 / 16 = 1. All values
+        # are read with a single request covering 6010..6021 range, so number
+        # of registers to read is 6021 - 6010 + 1 = 12.
+        raw_dryer_data: list[int] = _read_input_registers(
+            modbus_client=modbus_client, address=DRYER_PT00_INPUT,
+            count=DRYER_STATE_INPUT - DRYER_PT00_INPUT + 1
         )
 
-        print(f'Got raw dryer state data: {raw_dryer_state}')
+        print(f'Got raw dryer data: {raw_dryer_data}')
 
-        print(
-            f'Got decoded human-readable dryer state:'
-            f' {DryerState(raw_dryer_state[0]).name}'
+        dryer_state_name: str = DRYER_STATE_NAMES.get(
+            raw_dryer_data[DRYER_STATE_INPUT - DRYER_PT00_INPUT],
+            DryerState.UNKNOWN.name
         )
 
-        # Read 6010 and 6012 input registers. Each register type is float32, so
-        # number of registers to read is 32 / 16 = 2.
+        print(f'Got decoded human-readable dryer state: {dryer_state_name}')
+
         for register, description in (
             (DRYER_PT00_INPUT, 'PT00 pressure'),
             (DRYER_PT01_INPUT, 'PT01 pressure')
         ):
-            raw_pressure_data: list[int] = (
-                _read_input_registers(
-                    modbus_client=modbus_client, address=register, count=2
-                )
-            )
+            offset: int = register - DRYER_PT00_INPUT
 
-            # Convert raw response to single float value with pyModbusTCP
-            # utils.
-            converted_pressure_value: float = utils.decode_ieee(
-                val_int=utils.word_list_to_long(
-                    val_list=raw_pressure_data
-                )[0]
-            )
+            # Convert two big-endian words to single float value.
+            converted_pressure_value: float = FLOAT32.unpack(
+                TWO_REGISTERS.pack(*raw_dryer_data[offset:offset + 2])
+            )[0]
 
             print(f'Got {description} in bar: {converted_pressure_value}')
 
@@ -179,6 +201,9 @@ def main() -> None:
 
         raise
 
+    finally:
+        modbus_client.close()
+
 
 if __name__ == '__main__':
     main()
@@ -10,24 +10,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 import sys
 import time
 
-from typing import Final
+from typing import TYPE_CHECKING, Final, Optional
 
-try:
+if TYPE_CHECKING:
     from pyModbusTCP import client
 
-except ImportError:
-    print(
-        'No pyModbusTCP module installed.\n.'
-        '1. Create virtual environment\n'
-        '2. Run \'pip install pyModbusTCP==0.2.1\''
-    )
-
-    raise
-
 
 # Supported Python version
 MIN_PYTHON_VERSION: Final[tuple[int, int]] = (3, 10)
@@ -42,10 +35,29 @@ REGISTER_WRITE_TIMEOUT: Final[int] = 2
 # Timeout (seconds) to complete dryer reboot
 REBOOT_TIMEOUT: Final[int] = 5
 
+# Timeout (seconds) to check reboot counter while waiting for reboot
+REBOOT_CHECK_TIMEOUT: Final[float] = 0.2
+
 # Error message usually indicating that DCN is disabled
 SLAVE_DEVICE_FAILURE: Final[str] = 'slave device failure'
 
 
+class ModbusReadException(RuntimeError):
+    """
+    Custom exception to indicate runtime problems reading modbus registers.
+    """
+
+    pass
+
+
+class ModbusWriteException(RuntimeError):
+    """
+    Custom exception to indicate runtime problems writing modbus registers.
+    """
+
+    pass
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description='Write DRY reboot with Modbus'
@@ -63,14 +75,22 @@ def parse_args() -> argparse.Namespace:
 
 
 def _write_single_register(
-    modbus_client: client.ModbusClient, address: int, value: int
+    modbus_client: client.ModbusClient, address: int, value: int,
+    wait: bool = True
 ) -> None:
     """
-    Write 16 bits register.
+    Write 16 bits register and optionally wait until value is updated.
     """
-    modbus_client.write_single_register(reg_addr=address, reg_value=value)
+    if not modbus_client.write_single_register(
+        reg_addr=address, reg_value=value
+    ):
+        raise ModbusWriteException(
+            f'Failed to write value {value} to holding register at address'
+            f' {address}'
+        )
 
-    time.sleep(REGISTER_WRITE_TIMEOUT)
+    if wait:
+        time.sleep(REGISTER_WRITE_TIMEOUT)
 
 
 def _read_reboot_register(modbus_client: client.ModbusClient) -> int:
@@ -84,6 +104,37 @@ def _read_reboot_register(modbus_client: client.ModbusClient) -> int:
     )[0]
 
 
+def _wait_reboot(
+    modbus_client: client.ModbusClient, initial_reboot_counter: int
+) -> int:
+    """
+    Poll dryer reboot holding register until reboot counter differs from the
+    initial one or reboot timeout is expired, return the last reboot counter.
+    Reading returns None while dryer is rebooting.
+    """
+    wait_until: float = time.monotonic() + REBOOT_TIMEOUT
+
+    raw_reboot_data: Optional[list[int]] = None
+
+    while time.monotonic() < wait_until:
+        if (
+            raw_reboot_data := modbus_client.read_holding_registers(
+                reg_addr=DRYER_REBOOT_HOLDING, reg_nb=1
+            )
+        ) is not None and raw_reboot_data[0] != initial_reboot_counter:
+            return raw_reboot_data[0]
+
+        time.sleep(REBOOT_CHECK_TIMEOUT)
+
+    if raw_reboot_data is None:
+        raise ModbusReadException(
+            f'Failed to read reboot counter, dryer is not available after'
+            f' {REBOOT_TIMEOUT} seconds'
+        )
+
+    return raw_reboot_data[0]
+
+
 def main() -> None:
     if sys.version_info < MIN_PYTHON_VERSION:
         raise RuntimeError(
@@ -94,38 +145,61 @@ def main() -> None:
 
     args: argparse.Namespace = parse_args()
 
+    # Import pyModbusTCP only when it's really required, so printing help or
+    # failed version check doesn't spend time on loading it.
+    try:
+        from pyModbusTCP import client
+
+    except ImportError:
+        print(
+            'No pyModbusTCP module installed.\n.'
+            '1. Create virtual environment\n'
+            '2. Run \'pip install pyModbusTCP==0.2.1\''
+        )
+
+        raise
+
     modbus_client: client.ModbusClient = client.ModbusClient(
         host=args.modbus_ip, port=args.modbus_port
     )
 
     try:
-        print(
-            f'Got initial reboot counter: '
-            f'{_read_reboot_register(modbus_client=modbus_client)}'
+        # Open TCP connection once, all subsequent requests share it.
+        if not modbus_client.open():
+            raise RuntimeError(
+                f'Failed to connect to {args.modbus_ip}:{args.modbus_port}'
+            )
+
+        initial_reboot_counter: int = _read_reboot_register(
+            modbus_client=modbus_client
         )
 
+        print(f'Got initial reboot counter: {initial_reboot_counter}')
+
         print('Rebooting...')
 
-        # Write reboot holding register, address is 6020. Register type is
-        # uint16.
+        # Write reboot holding register, address is 6020, and save config
+        # holding register, address is 6022. Registers type is uint16. Register
+        # 6021 between them must not be written, so these are two requests
+        # sent back-to-back. Each write is acknowledged by dryer, so waiting
+        # is required only once after both of them.
         _write_single_register(
-            modbus_client=modbus_client, address=DRYER_REBOOT_HOLDING, value=1
+            modbus_client=modbus_client, address=DRYER_REBOOT_HOLDING,
+            value=1, wait=False
         )
 
-        # Write save config holding register, address is 6022. Register type is
-        # uint16.
         _write_single_register(
             modbus_client=modbus_client, address=DRYER_SAVE_CONFIG_HOLDING,
             value=1
         )
 
-        time.sleep(REBOOT_TIMEOUT)
-
-        print(
-            f'Got updated reboot counter: '
-            f'{_read_reboot_register(modbus_client=modbus_client)}'
+        updated_reboot_counter: int = _wait_reboot(
+            modbus_client=modbus_client,
+            initial_reboot_counter=initial_reboot_counter
         )
 
+        print(f'Got updated reboot counter: {updated_reboot_counter}')
+
     except Exception as e:
         # If something went wrong, we can access Modbus error/exception info.
         # For example, in case of connection problems, reading register will
@@ -140,6 +214,9 @@ def main() -> None:
 
         raise
 
+    finally:
+        modbus_client.close()
+
 
 if __name__ == '__main__':
     main()
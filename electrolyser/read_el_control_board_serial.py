@@ -11,23 +11,12 @@
 # limitations under the License.
 
 import argparse
+import struct
 import sys
 import uuid
 
 from typing import Final
 
-try:
-    from pyModbusTCP import client, utils
-
-except ImportError:
-    print(
-        'No pyModbusTCP module installed.\n.'
-        '1. Create virtual environment\n'
-        '2. Run \'pip install pyModbusTCP==0.2.1\''
-    )
-
-    raise
-
 
 # Supported Python version
 MIN_PYTHON_VERSION: Final[tuple[int, int]] = (3, 10)
@@ -62,11 +51,31 @@ def main() -> None:
 
     args: argparse.Namespace = parse_args()
 
+    # Import pyModbusTCP only when it's really required, so printing help or
+    # failed version check doesn't spend time on loading it.
+    try:
+        from pyModbusTCP import client
+
+    except ImportError:
+        print(
+            'No pyModbusTCP module installed.\n.'
+            '1. Create virtual environment\n'
+            '2. Run \'pip install pyModbusTCP==0.2.1\''
+        )
+
+        raise
+
     modbus_client: client.ModbusClient = client.ModbusClient(
         host=args.modbus_ip, port=args.modbus_port
     )
 
     try:
+        # Open TCP connection once, all subsequent requests share it.
+        if not modbus_client.open():
+            raise RuntimeError(
+                f'Failed to connect to {args.modbus_ip}:{args.modbus_port}'
+            )
+
         # Read control board serial input register, address is 6. Register type
         # is uint128, so number of registers to read is 128 / 16 = 8.
         raw_board_serial: list[int] = modbus_client.read_input_registers(
@@ -76,13 +85,10 @@ def main() -> None:
         print(f'Got raw control board serial data: {raw_board_serial}')
 
         # Convert raw response to single int value. pyModbusTCP utils has no
-        # built-in method for uint128, combining with 'manual' conversion.
-        long_long_list: list[int] = utils.word_list_to_long(
-            val_list=raw_board_serial, long_long=True
-        )
-
-        converted_board_serial: int = (
-            long_long_list[0] << 64 | long_long_list[1]
+        # built-in method for uint128, so pack big-endian words to bytes and
+        # convert them to int.
+        converted_board_serial: int = int.from_bytes(
+            struct.pack('>8H', *raw_board_serial), byteorder='big'
         )
 
         print(
@@ -110,6 +116,9 @@ def main() -> None:
 
         raise
 
+    finally:
+        modbus_client.close()
+
 
 if __name__ == '__main__':
     main()
@@ -11,23 +11,12 @@
 # limitations under the License.
 
 import argparse
+import struct
 import sys
 
 from enum import StrEnum
 from typing import Any, Final, Self
 
-try:
-    from pyModbusTCP import client, utils
-
-except ImportError:
-    print(
-        'No pyModbusTCP module installed.\n.'
-        '1. Create virtual environment\n'
-        '2. Run \'pip install pyModbusTCP==0.2.1\''
-    )
-
-    raise
-
 
 # Supported Python version
 MIN_PYTHON_VERSION: Final[tuple[int, int]] = (3, 10)
@@ -84,11 +73,31 @@ def main() -> None:
 
     args: argparse.Namespace = parse_args()
 
+    # Import pyModbusTCP only when it's really required, so printing help or
+    # failed version check doesn't spend time on loading it.
+    try:
+        from pyModbusTCP import client
+
+    except ImportError:
+        print(
+            'No pyModbusTCP module installed.\n.'
+            '1. Create virtual environment\n'
+            '2. Run \'pip install pyModbusTCP==0.2.1\''
+        )
+
+        raise
+
     modbus_client: client.ModbusClient = client.ModbusClient(
         host=args.modbus_ip, port=args.modbus_port
     )
 
     try:
+        # Open TCP connection once, all subsequent requests share it.
+        if not modbus_client.open():
+            raise RuntimeError(
+                f'Failed to connect to {args.modbus_ip}:{args.modbus_port}'
+            )
+
         # Read ProjectId input register, address is 0. Register type is uint32,
         # so number of registers to read is 32 / 16 = 2.
         raw_device_model: list[int] = modbus_client.read_input_registers(
@@ -97,16 +106,18 @@ def main() -> None:
 
         print(f'Got raw device model data: {raw_device_model}')
 
-        # Convert raw response to single int value with pyModbusTCP utils.
-        converted_device_model: int = utils.word_list_to_long(
-            val_list=raw_device_model
-        )[0]
+        # Pack raw response to big-endian bytes. Each byte is ASCII character
+        # of device model.
+        packed_device_model: bytes = struct.pack('>2H', *raw_device_model)
 
-        print(f'Got converted int value: {converted_device_model}')
+        print(
+            f'Got converted int value: '
+            f'{int.from_bytes(packed_device_model, byteorder="big")}'
+        )
 
-        # Decode converted int to human-readable device model.
+        # Decode packed bytes to human-readable device model.
         decoded_device_model: DeviceModel = DeviceModel(
-            bytes.fromhex(f'{converted_device_model:x}').decode()
+            packed_device_model.decode('ascii')
         )
 
         print(
@@ -125,6 +136,9 @@ def main() -> None:
 
         raise
 
+    finally:
+        modbus_client.close()
+
 
 if __name__ == '__main__':
     main()
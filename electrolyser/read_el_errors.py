@@ -16,18 +16,6 @@ import sys
 from enum import IntEnum
 from typing import Any, Final, Self
 
-try:
-    from pyModbusTCP import client
-
-except ImportError:
-    print(
-        'No pyModbusTCP module installed.\n.'
-        '1. Create virtual environment\n'
-        '2. Run \'pip install pyModbusTCP==0.2.1\''
-    )
-
-    raise
-
 
 # Supported Python version
 MIN_PYTHON_VERSION: Final[tuple[int, int]] = (3, 10)
@@ -35,6 +23,9 @@ MIN_PYTHON_VERSION: Final[tuple[int, int]] = (3, 10)
 # Register address
 ERRORS_INPUT: Final[int] = 832
 
+# Max number of error events following total amount in errors array
+MAX_ERRORS_COUNT: Final[int] = 32
+
 
 class Error(IntEnum):
     """
@@ -124,6 +115,12 @@ class Error(IntEnum):
         return cls.UNKNOWN
 
 
+# Human-readable error descriptions (name and hex value) by error value
+ERROR_DESCRIPTIONS: Final[dict[int, str]] = {
+    error.value: f'{error.name} ({hex(error.value)})' for error in Error
+}
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description='Reading EL errors with Modbus'
@@ -150,28 +147,62 @@ def main() -> None:
 
     args: argparse.Namespace = parse_args()
 
+    # Import pyModbusTCP only when it's really required, so printing help or
+    # failed version check doesn't spend time on loading it.
+    try:
+        from pyModbusTCP import client
+
+    except ImportError:
+        print(
+            'No pyModbusTCP module installed.\n.'
+            '1. Create virtual environment\n'
+            '2. Run \'pip install pyModbusTCP==0.2.1\''
+        )
+
+        raise
+
     modbus_client: client.ModbusClient = client.ModbusClient(
         host=args.modbus_ip, port=args.modbus_port
     )
 
     try:
+        # Open TCP connection once, all subsequent requests share it.
+        if not modbus_client.open():
+            raise RuntimeError(
+                f'Failed to connect to {args.modbus_ip}:{args.modbus_port}'
+            )
+
         # Read input register with errors array, address is 832. This register
         # has specific structure - first uint16 contains total amount of error
-        # events. Number of registers to read is 528 / 16 = 33.
-        raw_errors_data: list[int] = modbus_client.read_input_registers(
-            reg_addr=ERRORS_INPUT, reg_nb=33
+        # events, followed by up to 32 uint16 error events. Total amount is
+        # read first, so number of registers to read is 16 / 16 = 1.
+        raw_errors_count: list[int] = modbus_client.read_input_registers(
+            reg_addr=ERRORS_INPUT, reg_nb=1
         )
 
-        print(f'Got raw errors data: {raw_errors_data}')
+        print(f'Got raw errors count data: {raw_errors_count}')
 
-        if errors_count := raw_errors_data[0]:
+        if errors_count := raw_errors_count[0]:
             # Total amount of errors is not 0.
             print(f'Got total errors count: {errors_count}')
 
-            decoded_errors: list[str] = [
-                f'{Error(error).name} ({hex(error)})' for error in
-                raw_errors_data[1:errors_count + 1]
-            ]
+            # Read only active error events which follow total amount, each
+            # event is uint16, so number of registers to read is equal to
+            # total amount of errors, but not more than array size.
+            raw_errors_data: list[int] = modbus_client.read_input_registers(
+                reg_addr=ERRORS_INPUT + 1,
+                reg_nb=min(errors_count, MAX_ERRORS_COUNT)
+            )
+
+            print(f'Got raw errors data: {raw_errors_data}')
+
+            decoded_errors: list[str] = []
+
+            for error in raw_errors_data:
+                if (description := ERROR_DESCRIPTIONS.get(error)) is None:
+                    description = f'{Error.UNKNOWN.name} ({hex(error)})'
+
+                decoded_errors.append(description)
 
             print(
                 f'Got decoded errors: {", ".join(decoded_errors)}\nErrors'
@@ -193,6 +224,9 @@ def main() -> None:
 
         raise
 
+    finally:
+        modbus_client.close()
+
 
 if __name__ == '__main__':
     main()
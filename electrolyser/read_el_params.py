@@ -10,28 +10,46 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
+import struct
 import sys
+import time
 
 from enum import IntEnum
-from typing import Any, Final, Self
-
-try:
-    from pyModbusTCP import client, utils
-
-except ImportError:
-    print(
-        'No pyModbusTCP module installed.\n.'
-        '1. Create virtual environment\n'
-        '2. Run \'pip install pyModbusTCP==0.2.1\''
-    )
+from typing import TYPE_CHECKING, Any, Callable, Final, Optional, Self
 
-    raise
+if TYPE_CHECKING:
+    from pyModbusTCP import client
 
 
 # Supported Python version
 MIN_PYTHON_VERSION: Final[tuple[int, int]] = (3, 10)
 
+# Formats to convert two big-endian 16 bits registers to 32 bits values
+TWO_REGISTERS: Final[struct.Struct] = struct.Struct('>2H')
+FLOAT32: Final[struct.Struct] = struct.Struct('>f')
+UINT32: Final[struct.Struct] = struct.Struct('>I')
+
+# Number of attempts to read registers before giving up
+READ_ATTEMPTS: Final[int] = 3
+
+# Delay (seconds) before the second reading attempt, doubled for each next one
+READ_RETRY_DELAY: Final[float] = 0.05
+
+# Timeout (seconds) to wait for Modbus response. It's shorter than client
+# default (30 seconds), since failed reads are retried.
+MODBUS_TIMEOUT: Final[float] = 5
+
+
+class ModbusReadException(RuntimeError):
+    """
+    Custom exception to indicate runtime problems reading modbus registers.
+    """
+
+    pass
+
 
 class Holdings(IntEnum):
     """
@@ -58,6 +76,18 @@ class Inputs(IntEnum):
     WPS104_IN = 7009
 
 
+# Switches input registers with human-readable descriptions
+SWITCHES: Final[tuple[tuple[Inputs, str], ...]] = (
+    (Inputs.LSH102B_IN, 'High Electrolyte Level Switch'),
+    (Inputs.LSHH102A_IN, 'Very High Electrolyte Level Switch'),
+    (Inputs.LSL102D_IN, 'Low Electrolyte Level Switch'),
+    (Inputs.LSM102C_IN, 'Medium Electrolyte Level Switch'),
+    (Inputs.PSH102_IN, 'Electrolyte Tank High Pressure Switch'),
+    (Inputs.TSH108_IN, 'Electronic Compartment High Temperature Switch'),
+    (Inputs.WPS104_IN, 'Chassis Water Presence Switch')
+)
+
+
 class SystemState(IntEnum):
     """
     Values for state input register (18).
@@ -76,22 +106,85 @@ class SystemState(IntEnum):
         return cls.UNKNOWN
 
 
+# Human-readable system state names by state value
+SYSTEM_STATE_NAMES: Final[dict[int, str]] = {
+    state.value: state.name for state in SystemState
+}
+
+
+def _read_with_retries(
+    read_registers: Callable[..., Optional[list[int]]], address: int,
+    count: int
+) -> Optional[list[int]]:
+    """
+    Read registers with exponential backoff between attempts, so transient
+    connection problems don't abort the script. Client reopens closed
+    connection automatically on the next request.
+    """
+    for attempt in range(READ_ATTEMPTS):
+        if attempt:
+            time.sleep(READ_RETRY_DELAY * 2 ** (attempt - 1))
+
+        if (
+            raw_data := read_registers(reg_addr=address, reg_nb=count)
+        ) is not None:
+            return raw_data
+
+    return None
+
+
 def _read_input_registers(
     modbus_client: client.ModbusClient, address: int, count: int
 ) -> list[int]:
     """
-    Read input registers.
+    Read input registers. Reading function returns None on failure, so result
+    is checked before it gets to decoding.
     """
-    return modbus_client.read_input_registers(reg_addr=address, reg_nb=count)
+    if (
+        raw_data := _read_with_retries(
+            read_registers=modbus_client.read_input_registers,
+            address=address, count=count
+        )
+    ) is None:
+        raise ModbusReadException(
+            f'Failed to read {count} input register(s) at address {address}'
+        )
+
+    return raw_data
 
 
 def _read_holding_registers(
     modbus_client: client.ModbusClient, address: int, count: int
 ) -> list[int]:
     """
-    Read holding registers.
+    Read holding registers. Reading function returns None on failure, so
+    result is checked before it gets to decoding.
+    """
+    if (
+        raw_data := _read_with_retries(
+            read_registers=modbus_client.read_holding_registers,
+            address=address, count=count
+        )
+    ) is None:
+        raise ModbusReadException(
+            f'Failed to read {count} holding register(s) at address {address}'
+        )
+
+    return raw_data
+
+
+def _decode_float32(raw_data: list[int]) -> float:
+    """
+    Convert two registers to single float value.
+    """
+    return FLOAT32.unpack(TWO_REGISTERS.pack(*raw_data))[0]
+
+
+def _decode_uint32(raw_data: list[int]) -> int:
+    """
+    Convert two registers to single int value.
     """
-    return modbus_client.read_holding_registers(reg_addr=address, reg_nb=count)
+    return UINT32.unpack(TWO_REGISTERS.pack(*raw_data))[0]
 
 
 def parse_args() -> argparse.Namespace:
@@ -120,33 +213,56 @@ def main() -> None:
 
     args: argparse.Namespace = parse_args()
 
+    # Import pyModbusTCP only when it's really required, so printing help or
+    # failed version check doesn't spend time on loading it.
+    try:
+        from pyModbusTCP import client
+
+    except ImportError:
+        print(
+            'No pyModbusTCP module installed.\n.'
+            '1. Create virtual environment\n'
+            '2. Run \'pip install pyModbusTCP==0.2.1\''
+        )
+
+        raise
+
     modbus_client: client.ModbusClient = client.ModbusClient(
-        host=args.modbus_ip, port=args.modbus_port
+        host=args.modbus_ip, port=args.modbus_port, timeout=MODBUS_TIMEOUT
     )
 
     try:
-        # Read and decode system state input register, address is 18. Register
-        # type is enum16, technically it's similar to uint16, so number of
-        # registers to read is 16 / 16 = 1.
-        system_state: SystemState = SystemState(
-            _read_input_registers(
-                modbus_client=modbus_client,
-                address=Inputs.SYSTEM_STATE.value, count=1
-            )[0]
-        )
+        # Open TCP connection once, all subsequent requests share it.
+        if not modbus_client.open():
+            raise RuntimeError(
+                f'Failed to connect to {args.modbus_ip}:{args.modbus_port}'
+            )
 
-        print(f'Got system state: {system_state.name}')
+        # Read system state input register, address is 18, together with
+        # uptime input register, address is 22. System state register type is
+        # enum16, technically it's similar to uint16, so number of registers to
+        # read is 16 / 16 = 1. Uptime register type is uint32, so number of
+        # registers to read is 32 / 16 = 2. Both values are read with a single
+        # request covering 18..23 range, so number of registers to read is
+        # 22 - 18 + 2 = 6.
+        raw_system_data: list[int] = _read_input_registers(
+            modbus_client=modbus_client, address=Inputs.SYSTEM_STATE,
+            count=Inputs.UPTIME - Inputs.SYSTEM_STATE + 2
+        )
 
-        # Read uptime input register, address is 22. Register type is uint32,
-        # so number of registers to read is 32 / 16 = 2.
-        raw_uptime_data: list[int] = _read_input_registers(
-            modbus_client=modbus_client, address=Inputs.UPTIME.value, count=2
+        # Decode system state.
+        system_state_name: str = SYSTEM_STATE_NAMES.get(
+            raw_system_data[0], SystemState.UNKNOWN.name
         )
 
-        # Convert raw response to single int value with pyModbusTCP utils.
-        converted_uptime: int = utils.word_list_to_long(
-            val_list=raw_uptime_data
-        )[0]
+        print(f'Got system state: {system_state_name}')
+
+        uptime_offset: int = Inputs.UPTIME - Inputs.SYSTEM_STATE
+
+        # Convert raw uptime data to single int value.
+        converted_uptime: int = _decode_uint32(
+            raw_data=raw_system_data[uptime_offset:uptime_offset + 2]
+        )
 
         print(
             f'Got uptime in seconds: {converted_uptime}'
@@ -157,12 +273,12 @@ def main() -> None:
         # 32 / 16 = 2.
         raw_h2_production_data: list[int] = _read_input_registers(
             modbus_client=modbus_client,
-            address=Inputs.TOTAL_H2_PRODUCTION.value, count=2
+            address=Inputs.TOTAL_H2_PRODUCTION, count=2
         )
 
-        # Convert raw response to single float value with pyModbusTCP utils.
-        converted_h2_production: float = utils.decode_ieee(
-            val_int=utils.word_list_to_long(val_list=raw_h2_production_data)[0]
+        # Convert raw response to single float value.
+        converted_h2_production: float = _decode_float32(
+            raw_data=raw_h2_production_data
         )
 
         print(f'Got total H2 production in NL: {converted_h2_production}')
@@ -172,55 +288,50 @@ def main() -> None:
         raw_production_rate_data: list[int] = (
             _read_holding_registers(
                 modbus_client=modbus_client,
-                address=Holdings.PRODUCTION_RATE.value, count=2
+                address=Holdings.PRODUCTION_RATE, count=2
             )
         )
 
-        # Convert raw response to single float value with pyModbusTCP utils.
-        converted_production_rate: float = utils.decode_ieee(
-            val_int=utils.word_list_to_long(
-                val_list=raw_production_rate_data
-            )[0]
+        # Convert raw response to single float value.
+        converted_production_rate: float = _decode_float32(
+            raw_data=raw_production_rate_data
         )
 
         print(f'Got production rate in %: {converted_production_rate}')
 
         # Read 7000, 7001, 7002, 7003, 7004, 7007 and 7009 input registers
         # (switches). Each register type is boolean, technically it's similar
-        # to uint16, so number of registers to read is 16 / 16 = 1.
-        for register, description in (
-            (Inputs.LSH102B_IN, 'High Electrolyte Level Switch'),
-            (Inputs.LSHH102A_IN, 'Very High Electrolyte Level Switch'),
-            (Inputs.LSL102D_IN, 'Low Electrolyte Level Switch'),
-            (Inputs.LSM102C_IN, 'Medium Electrolyte Level Switch'),
-            (Inputs.PSH102_IN, 'Electrolyte Tank High Pressure Switch'),
-            (
-                Inputs.TSH108_IN,
-                'Electronic Compartment High Temperature Switch'
-            ),
-            (Inputs.WPS104_IN, 'Chassis Water Presence Switch')
-
-        ):
-            switch_value: bool = bool(
-                _read_input_registers(
-                    modbus_client=modbus_client, address=register.value,
-                    count=1
-                )[0]
-            )
+        # to uint16, so number of registers to read for each is 16 / 16 = 1.
+        # All switches are read with a single request covering 7000..7009
+        # range, so number of registers to read is 7009 - 7000 + 1 = 10.
+        raw_switches_data: list[int] = _read_input_registers(
+            modbus_client=modbus_client, address=Inputs.LSH102B_IN,
+            count=Inputs.WPS104_IN - Inputs.LSH102B_IN + 1
+        )
 
-            print(f'{register.name} ({description}) is {switch_value}')
+        # Format all switches at once and print them with a single call.
+        switches_lines: str = '\n'.join(
+            f'{register.name} ({description}) is'
+            f' {bool(raw_switches_data[register - Inputs.LSH102B_IN])}'
+            for register, description in SWITCHES
+        )
+
+        print(switches_lines)
 
     except Exception as e:
         # If something went wrong, we can access Modbus error/exception info.
         # For example, in case of connection problems, reading register will
-        # return None and script will fail with error while data converting,
-        # but real problem description will be stored in client.
+        # return None and script will fail with ModbusReadException, but real
+        # problem description will be stored in client.
         print(f'Exception occurred: {e}')
         print(f'Modbus error: {modbus_client.last_error_as_txt}')
         print(f'Modbus exception: {modbus_client.last_except_as_txt}')
 
         raise
 
+    finally:
+        modbus_client.close()
+
 
 if __name__ == '__main__':
     main()
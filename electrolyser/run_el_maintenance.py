@@ -12,14 +12,15 @@
 
 import argparse
 import os
+import struct
 import sys
 import time
 
 from enum import IntEnum, StrEnum
-from typing import Any, Final, Self, TypeAlias, Union
+from typing import Any, Callable, Final, Iterator, Optional, Self
 
 try:
-    from pyModbusTCP import client, utils
+    from pyModbusTCP import client
 
 except ImportError:
     print(
@@ -34,6 +35,11 @@ except ImportError:
 # Supported Python version
 MIN_PYTHON_VERSION: Final[tuple[int, int]] = (3, 10)
 
+# Formats to convert two big-endian 16 bits registers to 32 bits values
+TWO_REGISTERS: Final[struct.Struct] = struct.Struct('>2H')
+FLOAT32: Final[struct.Struct] = struct.Struct('>f')
+UINT32: Final[struct.Struct] = struct.Struct('>I')
+
 # Windows platform id
 WIN32: Final[str] = 'win32'
 
@@ -49,12 +55,24 @@ REFILLING_STATE_CHECK_TIMEOUT: Final[int] = 5
 # Timeout (seconds) to check electrolyte presence while draining/refilling
 ELECTROLYTE_PRESENCE_CHECK_TIMEOUT: Final[int] = 10
 
-# Timeout (seconds) after writing to somehow guarantee that value is updated
+# Initial timeout (seconds) between checks while waiting for level or state,
+# multiplied by factor after each check up to the corresponding check timeout
+WAIT_CHECK_INITIAL_TIMEOUT: Final[float] = 0.2
+WAIT_CHECK_TIMEOUT_FACTOR: Final[float] = 1.5
+
+# Timeout (seconds) after writing to guarantee that value is updated, max one
+# if written value is polled
 REGISTER_WRITE_TIMEOUT: Final[int] = 2
 
+# Timeout (seconds) to check if written value is applied
+REGISTER_WRITE_CHECK_TIMEOUT: Final[float] = 0.1
+
 # Check pressure and electrolyte presence (optionally) after pipe connection
 MAX_WATER_PIPE_CONNECT_ATTEMPTS: Final[int] = 5
 
+# Max number of events following total amount in warnings and errors arrays
+MAX_EVENTS_COUNT: Final[int] = 32
+
 INPUT_CONFIRMATION: Final[str] = 'YES'
 
 
@@ -183,6 +201,10 @@ class State(IntEnum):
         return cls.UNKNOWN
 
 
+# States by state value
+STATES: Final[dict[int, State]] = {state.value: state for state in State}
+
+
 class RefillingState(IntEnum):
     """
     Enum values for Electrolyser refilling state input register (1201).
@@ -210,6 +232,13 @@ class RefillingState(IntEnum):
         return cls.UNKNOWN
 
 
+# Refilling states by refilling state value
+REFILLING_STATES: Final[dict[int, RefillingState]] = {
+    refilling_state.value: refilling_state
+    for refilling_state in RefillingState
+}
+
+
 class ElError(IntEnum):
     """
     Values for errors register (832). Names may be used for human-readable
@@ -299,6 +328,12 @@ class ElError(IntEnum):
         return cls.UNKNOWN
 
 
+# Human-readable error descriptions (name and hex value) by error value
+EL_ERROR_DESCRIPTIONS: Final[dict[int, str]] = {
+    error.value: f'{error.name} ({hex(error.value)})' for error in ElError
+}
+
+
 class ElWarning(IntEnum):
     """
     Values for warnings input register (768). Names may be used for
@@ -363,7 +398,16 @@ class ElWarning(IntEnum):
         return cls.UNKNOWN
 
 
-Event: TypeAlias = Union[type(ElError), type(ElWarning)]
+# Human-readable warning descriptions (name and hex value) by warning value
+EL_WARNING_DESCRIPTIONS: Final[dict[int, str]] = {
+    warning.value: f'{warning.name} ({hex(warning.value)})'
+    for warning in ElWarning
+}
+
+# Warnings indicating problems while refilling
+REFILLING_WARNINGS: Final[frozenset[int]] = frozenset(
+    {ElWarning.WR_10, ElWarning.WR_20, ElWarning.WR_21, ElWarning.WR_22}
+)
 
 
 def _text_color(text: str, color: ConsoleColor) -> str:
@@ -419,15 +463,52 @@ def _read_holding_registers(
     return modbus_client.read_holding_registers(reg_addr=address, reg_nb=count)
 
 
+def _wait_registers(
+    read_registers: Callable[..., Optional[list[int]]], address: int,
+    count: int, applied: Callable[[list[int]], bool]
+) -> None:
+    """
+    Poll registers until their values are considered applied or write timeout
+    is expired. Result is not checked here, callers validate it on their own.
+    """
+    wait_until: float = time.monotonic() + REGISTER_WRITE_TIMEOUT
+
+    while time.monotonic() < wait_until:
+        if (
+            raw_data := read_registers(reg_addr=address, reg_nb=count)
+        ) is not None and applied(raw_data):
+            break
+
+        time.sleep(REGISTER_WRITE_CHECK_TIMEOUT)
+
+
 def _write_single_register(
-    modbus_client: client.ModbusClient, address: int, value: int
+    modbus_client: client.ModbusClient, address: int, value: int,
+    wait: bool = True
 ) -> None:
     """
-    Write 16 bits register.
+    Write 16 bits register and optionally wait for write timeout. Holding
+    register reads back written value immediately, so callers having status
+    registers poll them instead of waiting.
     """
     modbus_client.write_single_register(reg_addr=address, reg_value=value)
 
-    time.sleep(REGISTER_WRITE_TIMEOUT)
+    if wait:
+        time.sleep(REGISTER_WRITE_TIMEOUT)
+
+
+def _decode_float32(raw_data: list[int]) -> float:
+    """
+    Convert two registers to single float value.
+    """
+    return FLOAT32.unpack(TWO_REGISTERS.pack(*raw_data))[0]
+
+
+def _decode_uint32(raw_data: list[int]) -> int:
+    """
+    Convert two registers to single int value.
+    """
+    return UINT32.unpack(TWO_REGISTERS.pack(*raw_data))[0]
 
 
 def _format_event(name: str, value: int) -> str:
@@ -437,42 +518,72 @@ def _format_event(name: str, value: int) -> str:
     return f'{name} ({hex(value)})'
 
 
-def _format_warning(warning: ElWarning) -> str:
+def _read_events(
+    modbus_client: client.ModbusClient, register: Inputs
+) -> list[int]:
     """
-    Format warning event.
+    Read input register with events (warnings or errors) array and return
+    active events values.
     """
-    return _format_event(name=warning.name, value=warning.value)
+    # These registers have specific structure - first uint16 contains total
+    # amount of events, followed by up to 32 uint16 events. Total amount is
+    # read first, so number of registers to read is 16 / 16 = 1.
+    if (
+        raw_events_count := modbus_client.read_input_registers(
+            reg_addr=register.value, reg_nb=1
+        )
+    ) is None:
+        raise MaintenanceModeException(
+            f'Failed to read {register.name} events count'
+        )
+
+    if not (events_count := raw_events_count[0]):
+        return []
+
+    # Read only active events which follow total amount, each event is
+    # uint16, so number of registers to read is equal to total amount, but
+    # not more than array size.
+    if (
+        events := modbus_client.read_input_registers(
+            reg_addr=register.value + 1,
+            reg_nb=min(events_count, MAX_EVENTS_COUNT)
+        )
+    ) is None:
+        raise MaintenanceModeException(
+            f'Failed to read {register.name} events'
+        )
+
+    return events
 
 
-def _decode_events(
-    modbus_client: client.ModbusClient, register: Inputs, event_type: Event
+def _format_events(
+    events: list[int], event_descriptions: dict[int, str], unknown_name: str
 ) -> list[str]:
-    # Read and decode input register with events (warnings or errors) array.
-    # These registers have specific structure - first uint16 contains total
-    # amount of events. Number of registers to read is 528 / 16 = 33.
-    events: list[str] = []
+    """
+    Format events values as human-readable names and hex values. Descriptions
+    of known events are precomputed, so only unknown ones are formatted.
+    """
+    formatted_events: list[str] = []
 
-    raw_events_data: list[int] = modbus_client.read_input_registers(
-        reg_addr=register.value, reg_nb=33
-    )
+    for event in events:
+        if (description := event_descriptions.get(event)) is None:
+            description = _format_event(name=unknown_name, value=event)
 
-    if events_count := raw_events_data[0]:
-        # Total amount of events is not 0.
-        events = [
-            _format_event(name=event_type(event).name, value=event)
-            for event in raw_events_data[1:events_count + 1]
-        ]
+        formatted_events.append(description)
 
-    return events
+    return formatted_events
 
 
 def _decode_warnings(modbus_client: client.ModbusClient) -> list[str]:
     """
     Read and decode input register with warnings, address is 768.
     """
-    return _decode_events(
-        modbus_client=modbus_client, register=Inputs.WARNINGS,
-        event_type=ElWarning
+    return _format_events(
+        events=_read_events(
+            modbus_client=modbus_client, register=Inputs.WARNINGS
+        ),
+        event_descriptions=EL_WARNING_DESCRIPTIONS,
+        unknown_name=ElWarning.UNKNOWN.name
     )
 
 
@@ -480,9 +591,12 @@ def _decode_errors(modbus_client: client.ModbusClient) -> list[str]:
     """
     Read and decode input register with errors, address is 832.
     """
-    return _decode_events(
-        modbus_client=modbus_client, register=Inputs.ERRORS,
-        event_type=ElError
+    return _format_events(
+        events=_read_events(
+            modbus_client=modbus_client, register=Inputs.ERRORS
+        ),
+        event_descriptions=EL_ERROR_DESCRIPTIONS,
+        unknown_name=ElError.UNKNOWN.name
     )
 
 
@@ -492,16 +606,15 @@ def _check_refilling_warnings(modbus_client: client.ModbusClient) -> None:
     """
     print('Checking if any refilling warnings exist...')
 
-    if active_warnings := _decode_warnings(modbus_client=modbus_client):
-        if any(
-            warning in (
-                _format_warning(warning=ElWarning.WR_10),
-                _format_warning(warning=ElWarning.WR_20),
-                _format_warning(warning=ElWarning.WR_21),
-                _format_warning(warning=ElWarning.WR_22),
-            )
-            for warning in active_warnings
-        ):
+    if warnings := _read_events(
+        modbus_client=modbus_client, register=Inputs.WARNINGS
+    ):
+        active_warnings: list[str] = _format_events(
+            events=warnings, event_descriptions=EL_WARNING_DESCRIPTIONS,
+            unknown_name=ElWarning.UNKNOWN.name
+        )
+
+        if not REFILLING_WARNINGS.isdisjoint(warnings):
             raise MaintenanceModeException(
                 f'Seems like something went wrong while refilling, active'
                 f' warnings are: {", ".join(active_warnings)}\nPlease'
@@ -526,10 +639,10 @@ def _actual_state(modbus_client: client.ModbusClient) -> State:
     enum16, technically it's similar to uint16, so number of registers to read
     is 16 / 16 = 1.
     """
-    state: State = State(
+    state: State = STATES.get(
         _read_input_registers(
             modbus_client=modbus_client, address=Inputs.STATE.value, count=1
-        )[0]
+        )[0], State.UNKNOWN
     )
 
     _print_cyan(text=f'{state.name} system state detected...')
@@ -542,13 +655,11 @@ def _actual_water_inlet_pressure(modbus_client: client.ModbusClient) -> float:
     Read and decode water inlet pressure input register, address is 7516.
     Register type is float32, so number of registers to read is 32 / 16 = 2.
     """
-    return utils.decode_ieee(
-        val_int=utils.word_list_to_long(
-            val_list=_read_input_registers(
-                modbus_client=modbus_client, address=Inputs.PT105_IN_BAR.value,
-                count=2
-            )
-        )[0]
+    return _decode_float32(
+        raw_data=_read_input_registers(
+            modbus_client=modbus_client, address=Inputs.PT105_IN_BAR.value,
+            count=2
+        )
     )
 
 
@@ -560,11 +671,11 @@ def _actual_refilling_state(
     type is enum16, technically it's similar to uint16, so number of registers
     to read is 16 / 16 = 1.
     """
-    return RefillingState(
+    return REFILLING_STATES.get(
         _read_input_registers(
             modbus_client=modbus_client, address=Inputs.REFILLING_STATE.value,
             count=1
-        )[0]
+        )[0], RefillingState.UNKNOWN
     )
 
 
@@ -574,117 +685,68 @@ def _actual_refilling_mixing_time(modbus_client: client.ModbusClient) -> int:
     Register type is uint32, so number of registers to read is 32 / 16 = 2.
     Decoded value is in ms, return value is in seconds.
     """
-    return utils.word_list_to_long(
-        val_list=_read_holding_registers(
+    return _decode_uint32(
+        raw_data=_read_holding_registers(
             modbus_client=modbus_client,
             address=Holdings.REFILLING_MIXINGTIME_MS.value, count=2
         )
-    )[0] // 1000
+    ) // 1000
 
 
-def _actual_refilling_min_water_pressure(
+def _actual_refilling_water_pressure_bounds(
     modbus_client: client.ModbusClient
-) -> float:
+) -> tuple[float, float]:
     """
-    Read and decode refilling min water pressure holding register, address is
-    4400. Register type is float32, so number of registers to read is
-    32 / 16 = 2.
+    Read and decode refilling min and max water pressure holding registers,
+    addresses are 4400 and 4402. Each register type is float32, so number of
+    registers to read for each is 32 / 16 = 2. Both values are read with a
+    single request covering 4400..4403 range, so number of registers to read
+    is 4402 - 4400 + 2 = 4.
     """
-    return utils.decode_ieee(
-        val_int=utils.word_list_to_long(
-            val_list=_read_holding_registers(
-                modbus_client=modbus_client,
-                address=Holdings.REFILLING_MINWATERPPESSURE_BAR.value, count=2
-            )
-        )[0]
-    )
-
+    min_address: int = Holdings.REFILLING_MINWATERPPESSURE_BAR.value
 
-def _actual_refilling_max_water_pressure(
-    modbus_client: client.ModbusClient
-) -> float:
-    """
-    Read and decode refilling max water pressure holding register, address is
-    4402. Register type is float32, so number of registers to read is
-    32 / 16 = 2.
-    """
-    return utils.decode_ieee(
-        val_int=utils.word_list_to_long(
-            val_list=_read_holding_registers(
-                modbus_client=modbus_client,
-                address=Holdings.REFILLING_MAXWATERPPESSURE_BAR.value, count=2
-            )
-        )[0]
+    count: int = (
+        Holdings.REFILLING_MAXWATERPPESSURE_BAR.value - min_address + 2
     )
 
-
-def _low_level_switch(modbus_client: client.ModbusClient) -> bool:
-    """
-    Read electrolyte low level switch (7002). Register type is boolean,
-    technically it's similar to uint16, so number of registers to read is
-    16 / 16 = 1.
-    """
-    return bool(
-        _read_input_registers(
-            modbus_client=modbus_client, address=Inputs.LSL102D_IN.value,
-            count=1
-        )[0]
+    raw_pressure_data: list[int] = _read_holding_registers(
+        modbus_client=modbus_client, address=min_address, count=count
     )
 
-
-def _medium_level_switch(modbus_client: client.ModbusClient) -> bool:
-    """
-    Read electrolyte medium level switch (7003). Register type is boolean,
-    technically it's similar to uint16, so number of registers to read is
-    16 / 16 = 1.
-    """
-    return bool(
-        _read_input_registers(
-            modbus_client=modbus_client, address=Inputs.LSM102C_IN.value,
-            count=1
-        )[0]
+    return (
+        _decode_float32(raw_data=raw_pressure_data[:2]),
+        _decode_float32(raw_data=raw_pressure_data[2:])
     )
 
 
-def _high_level_switch(modbus_client: client.ModbusClient) -> bool:
+def _level_switches(modbus_client: client.ModbusClient) -> int:
     """
-    Read electrolyte high level switch (7000). Register type is boolean,
-    technically it's similar to uint16, so number of registers to read is
-    16 / 16 = 1.
+    Read electrolyte level switches: high (7000), very high (7001), low (7002)
+    and medium (7003). Each register type is boolean, technically it's similar
+    to uint16, so number of registers to read for each is 16 / 16 = 1. All
+    switches are read with a single request covering 7000..7003 range, so
+    number of registers to read is 7003 - 7000 + 1 = 4. Switches are returned
+    as bitmask ordered from the lowest level (bit 0) to the highest one
+    (bit 3), so number of the top enabled bit is equal to electrolyte level.
     """
-    return bool(
-        _read_input_registers(
-            modbus_client=modbus_client, address=Inputs.LSH102B_IN.value,
-            count=1
-        )[0]
+    raw_switches_data: list[int] = _read_input_registers(
+        modbus_client=modbus_client, address=Inputs.LSH102B_IN.value,
+        count=Inputs.LSM102C_IN.value - Inputs.LSH102B_IN.value + 1
     )
 
-
-def _very_high_level_switch(modbus_client: client.ModbusClient) -> bool:
-    """
-    Read electrolyte very high level switch (7001). Register type is boolean,
-    technically it's similar to uint16, so number of registers to read is
-    16 / 16 = 1.
-    """
-    return bool(
-        _read_input_registers(
-            modbus_client=modbus_client, address=Inputs.LSHH102A_IN.value,
-            count=1
-        )[0]
+    # Switches registers are ordered as high, very high, low and medium.
+    high, very_high, low, medium = (
+        bool(switch) for switch in raw_switches_data
     )
 
+    return low | medium << 1 | high << 2 | very_high << 3
+
 
-def _search_top_switch(switches: list[bool], enabled: bool) -> int:
+def _report_electrolyte_level(electrolyte_level: ElectrolyteLevel) -> None:
     """
-    Search first from the top (highest) enabled or disabled electrolyte level
-    switch.
+    Report detected electrolyte level.
     """
-    return next(
-        (
-            len(switches) - index for index, switch in
-            enumerate(reversed(switches), start=0) if switch is enabled
-        ), 0
-    )
+    _print_cyan(text=f'{electrolyte_level.name} electrolyte level detected...')
 
 
 def _electrolyte_level(
@@ -694,22 +756,16 @@ def _electrolyte_level(
     Read and report electrolyte level.
     """
 
-    switches: list[bool] = [
-        _low_level_switch(modbus_client=modbus_client),
-        _medium_level_switch(modbus_client=modbus_client),
-        _high_level_switch(modbus_client=modbus_client),
-        _very_high_level_switch(modbus_client=modbus_client)
-    ]
+    switches: int = _level_switches(modbus_client=modbus_client)
 
     electrolyte_level: ElectrolyteLevel = ElectrolyteLevel(
-        _search_top_switch(switches=switches, enabled=True)
+        switches.bit_length()
     )
 
-    if not all(switches_below_max := switches[:electrolyte_level.value]):
+    # All switches below the top enabled one must be enabled too.
+    if disabled_below := ~switches & ((1 << electrolyte_level.value) - 1):
         top_disabled_level: ElectrolyteLevel = ElectrolyteLevel(
-            _search_top_switch(
-                switches=switches_below_max, enabled=False
-            )
+            disabled_below.bit_length()
         )
 
         raise MaintenanceModeException(
@@ -719,9 +775,7 @@ def _electrolyte_level(
         )
 
     if logging:
-        _print_cyan(
-            text=f'{electrolyte_level.name} electrolyte level detected...'
-        )
+        _report_electrolyte_level(electrolyte_level=electrolyte_level)
 
     return electrolyte_level
 
@@ -732,11 +786,39 @@ def _toggle_maintenance(
     """
     Write maintenance holding register, address is 1013. Register type is
     boolean, technically it's similar to uint16. We must write 1/0 to turn
-    Maintenance mode on/off.
+    Maintenance mode on/off. State (1200) and refilling state (1201) input
+    registers are polled until Maintenance mode is actually turned on/off and
+    refilling state follows it, so it's up to date for further checks.
     """
+    # Read refilling state input register, address is 1201. Register type is
+    # enum16, technically it's similar to uint16, so number of registers to
+    # read is 16 / 16 = 1. Raw value is kept to detect its change.
+    if (
+        raw_refilling_state_data := modbus_client.read_input_registers(
+            reg_addr=Inputs.REFILLING_STATE.value, reg_nb=1
+        )
+    ) is None:
+        raise MaintenanceModeException('Failed to read refilling state')
+
+    expected_state: State = State.MAINTENANCE_MODE if enable else State.IDLE
+
     _write_single_register(
         modbus_client=modbus_client, address=Holdings.MAINTENANCE.value,
-        value=int(enable)
+        value=int(enable), wait=False
+    )
+
+    # Read state and refilling state input registers with a single request
+    # covering 1200..1201 range, so number of registers to read is
+    # 1201 - 1200 + 1 = 2. Both are polled within the same write timeout.
+    _wait_registers(
+        read_registers=modbus_client.read_input_registers,
+        address=Inputs.STATE.value,
+        count=Inputs.REFILLING_STATE.value - Inputs.STATE.value + 1,
+        applied=lambda raw_states_data: (
+            raw_states_data[0] == expected_state.value
+        ) and (
+            raw_states_data[1] != raw_refilling_state_data[0]
+        )
     )
 
 
@@ -1024,17 +1106,19 @@ def _perform_refilling(
         )
 
     finally:
-        if el_21 and _electrolyte_level(
+        # Electrolyte level is read once and reused below, it can't change
+        # significantly between these checks.
+        electrolyte_level: ElectrolyteLevel = _electrolyte_level(
             modbus_client=modbus_client
-        ).value < ElectrolyteLevel.HIGH.value:
+        )
+
+        if el_21 and electrolyte_level.value < ElectrolyteLevel.HIGH.value:
             _check_refilling_state(
                 modbus_client=modbus_client,
                 expected_refilling_state=RefillingState.KOH_REFILLING
             )
 
-    if _electrolyte_level(
-        modbus_client=modbus_client
-    ).value < refill_to_level.value:
+    if electrolyte_level.value < refill_to_level.value:
         _print_yellow(
             text=(
                 f'Now carefully raise the electrolyte bag above the device to'
@@ -1101,21 +1185,60 @@ def _finish_refilling(modbus_client: client.ModbusClient) -> None:
     )
 
 
+def _check_timeouts(max_timeout: float) -> Iterator[float]:
+    """
+    Generate timeouts between checks while waiting for level or state. Each
+    timeout is longer than previous one until max timeout is reached.
+    """
+    check_timeout: float = WAIT_CHECK_INITIAL_TIMEOUT
+
+    while True:
+        yield check_timeout
+
+        check_timeout = min(
+            check_timeout * WAIT_CHECK_TIMEOUT_FACTOR, max_timeout
+        )
+
+
 def _wait_electrolyte_level(
     modbus_client: client.ModbusClient, expected_level: ElectrolyteLevel,
     timeout: int, refilling: bool = False
 ) -> None:
     """
-    Wait for specific electrolyte level.
+    Wait for specific electrolyte level. Level is checked more often at the
+    beginning and after each change, but it's reported only when changed or
+    once per check timeout.
     """
-    wait_until: float = time.time() + timeout
+    wait_until: float = time.monotonic() + timeout
 
-    while time.time() < wait_until:
-        if (
-            electrolyte_level := _electrolyte_level(
-                modbus_client=modbus_client
+    check_timeouts: Iterator[float] = _check_timeouts(
+        max_timeout=ELECTROLYTE_PRESENCE_CHECK_TIMEOUT
+    )
+
+    reported_level: Optional[ElectrolyteLevel] = None
+    report_at: float = time.monotonic()
+
+    while time.monotonic() < wait_until:
+        electrolyte_level: ElectrolyteLevel = _electrolyte_level(
+            modbus_client=modbus_client, logging=False
+        )
+
+        if electrolyte_level is not reported_level:
+            # Level is changing, so check it more often again and report it
+            # immediately.
+            check_timeouts = _check_timeouts(
+                max_timeout=ELECTROLYTE_PRESENCE_CHECK_TIMEOUT
             )
-        ) is expected_level:
+
+            report_at = time.monotonic()
+
+        if time.monotonic() >= report_at:
+            _report_electrolyte_level(electrolyte_level=electrolyte_level)
+
+            reported_level = electrolyte_level
+            report_at = time.monotonic() + ELECTROLYTE_PRESENCE_CHECK_TIMEOUT
+
+        if electrolyte_level is expected_level:
             break
 
         elif (
@@ -1128,7 +1251,7 @@ def _wait_electrolyte_level(
                 f' Enapter customer support.'
             )
 
-        time.sleep(ELECTROLYTE_PRESENCE_CHECK_TIMEOUT)
+        time.sleep(next(check_timeouts))
 
     else:
         raise MaintenanceModeException(
@@ -1142,17 +1265,34 @@ def _wait_refilling_state(
     timeout: int
 ) -> None:
     """
-    Wait for specific refilling state.
+    Wait for specific refilling state. State is checked more often at the
+    beginning and after each change.
     """
-    wait_until: float = time.time() + timeout
+    wait_until: float = time.monotonic() + timeout
 
-    while time.time() < wait_until:
-        if _actual_refilling_state(
-            modbus_client=modbus_client
+    check_timeouts: Iterator[float] = _check_timeouts(
+        max_timeout=REFILLING_STATE_CHECK_TIMEOUT
+    )
+
+    last_state: Optional[RefillingState] = None
+
+    while time.monotonic() < wait_until:
+        if (
+            refilling_state := _actual_refilling_state(
+                modbus_client=modbus_client
+            )
         ) is expected_state:
             break
 
-        time.sleep(REFILLING_STATE_CHECK_TIMEOUT)
+        if refilling_state is not last_state:
+            # Refilling state is changing, so check it more often again.
+            check_timeouts = _check_timeouts(
+                max_timeout=REFILLING_STATE_CHECK_TIMEOUT
+            )
+
+            last_state = refilling_state
+
+        time.sleep(next(check_timeouts))
 
     else:
         raise MaintenanceModeException(
@@ -1174,11 +1314,7 @@ def _check_water_pipe_connection(
     pressure_ok: bool = False
     electrolyte_ok: bool = False
 
-    min_pressure: float = _actual_refilling_min_water_pressure(
-        modbus_client=modbus_client
-    )
-
-    max_pressure: float = _actual_refilling_max_water_pressure(
+    min_pressure, max_pressure = _actual_refilling_water_pressure_bounds(
         modbus_client=modbus_client
     )
 
@@ -1350,8 +1486,9 @@ def _run_maintenance_4x(
         _perform_draining(modbus_client=modbus_client)
 
     # Handle situation when script was somehow interrupted and flushing is
-    # already complete.
-    if _actual_refilling_state(
+    # already complete. Refilling state is re-read only if flushing is still
+    # considered required.
+    if flushing_required and _actual_refilling_state(
         modbus_client=modbus_client
     ) is RefillingState.MAINTENANCE:
         flushing_required = False
@@ -1394,20 +1531,19 @@ def _run_maintenance(
     """
 
     # Read and decode ProjectId input register, address is 0. Register type is
-    # uint32, so number of registers to read is 32 / 16 = 2. First convert raw
-    # response to single int value with pyModbusTCP utils.
-    converted_device_model: int = utils.word_list_to_long(
-        val_list=_read_input_registers(
+    # uint32, so number of registers to read is 32 / 16 = 2. Register holds
+    # ASCII characters of device model, so raw response is packed directly to
+    # big-endian bytes without converting to single int value.
+    packed_device_model: bytes = TWO_REGISTERS.pack(
+        *_read_input_registers(
             modbus_client=modbus_client, address=Inputs.DEVICE_MODEL.value,
             count=2
         )
-    )[0]
+    )
 
-    # Decode converted int to human-readable device model.
+    # Decode packed bytes to human-readable device model.
     match DeviceModel(
-        decoded_device_name := bytes.fromhex(
-            f'{converted_device_model:x}'
-        ).decode()
+        decoded_device_name := packed_device_model.decode()
     ):
         case DeviceModel.EL21:
             _run_maintenance_21(
@@ -1485,6 +1621,12 @@ def main() -> None:
     )
 
     try:
+        # Open TCP connection once, all subsequent requests share it.
+        if not modbus_client.open():
+            raise RuntimeError(
+                f'Failed to connect to {args.modbus_ip}:{args.modbus_port}'
+            )
+
         _print_yellow('Checking if Maintenance can be performed...')
 
         if _electrolyte_level(
@@ -1519,29 +1661,43 @@ def main() -> None:
         print(f'Modbus error: {modbus_client.last_error_as_txt}')
         print(f'Modbus exception: {modbus_client.last_except_as_txt}')
 
-        active_errors: str = (
-            ', '.join(
-                _decode_errors(modbus_client=modbus_client)
-            ) or 'No errors'
-        )
+        # Failure to read events must not hide the original exception.
+        try:
+            active_errors: str = (
+                ', '.join(
+                    _decode_errors(modbus_client=modbus_client)
+                ) or 'No errors'
+            )
 
-        active_warnings: str = (
-            ', '.join(
-                _decode_warnings(modbus_client=modbus_client)
-            ) or 'No warnings'
-        )
+            active_warnings: str = (
+                ', '.join(
+                    _decode_warnings(modbus_client=modbus_client)
+                ) or 'No warnings'
+            )
 
-        _print_red(
-            text=(
-                f'Please provide the following errors and warnings to Enapter'
-                f' customer support:\nErrors: {active_errors}\nWarnings: '
-                f'{active_warnings}\nEvents description is available at'
-                f' https://handbook.enapter.com'
+        except MaintenanceModeException as events_exception:
+            _print_red(
+                text=(
+                    f'{events_exception}, please contact Enapter customer'
+                    f' support'
+                )
+            )
+
+        else:
+            _print_red(
+                text=(
+                    f'Please provide the following errors and warnings to'
+                    f' Enapter customer support:\nErrors: {active_errors}\n'
+                    f'Warnings: {active_warnings}\nEvents description is'
+                    f' available at https://handbook.enapter.com'
+                )
             )
-        )
 
         raise
 
+    finally:
+        modbus_client.close()
+
 
 if __name__ == '__main__':
     main()
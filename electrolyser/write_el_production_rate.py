@@ -12,13 +12,14 @@
 
 import argparse
 import random
+import struct
 import sys
 import time
 
 from typing import Final
 
 try:
-    from pyModbusTCP import client, utils
+    from pyModbusTCP import client
 
 except ImportError:
     print(
@@ -35,9 +36,16 @@ MIN_PYTHON_VERSION: Final[tuple[int, int]] = (3, 10)
 # Register address
 PRODUCTION_RATE_HOLDING: Final[int] = 1002
 
-# Timeout after writing to somehow guarantee that value is updated
+# Formats to convert float32 value to/from two big-endian 16 bits registers
+TWO_REGISTERS: Final[struct.Struct] = struct.Struct('>2H')
+FLOAT32: Final[struct.Struct] = struct.Struct('>f')
+
+# Max timeout after writing to guarantee that value is updated
 REGISTER_WRITE_TIMEOUT: Final[int] = 2
 
+# Timeout (seconds) to check if written value is applied
+REGISTER_WRITE_CHECK_TIMEOUT: Final[float] = 0.1
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -55,18 +63,23 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _decode_production_rate(raw_data: list[int]) -> float:
+    """
+    Convert two registers to single float value.
+    """
+    return FLOAT32.unpack(TWO_REGISTERS.pack(*raw_data))[0]
+
+
 def _read_production_rate(modbus_client: client.ModbusClient) -> float:
     """
     Read production rate holding register, address is 1002. Register type is
     float32, so number of registers to read is 32 / 16 = 2. Convert raw
-    response to single float value with pyModbusTCP utils.
+    response to single float value.
     """
-    return utils.decode_ieee(
-        val_int=utils.word_list_to_long(
-            val_list=modbus_client.read_holding_registers(
-                reg_addr=PRODUCTION_RATE_HOLDING, reg_nb=2
-            )
-        )[0]
+    return _decode_production_rate(
+        raw_data=modbus_client.read_holding_registers(
+            reg_addr=PRODUCTION_RATE_HOLDING, reg_nb=2
+        )
     )
 
 
@@ -85,6 +98,12 @@ def main() -> None:
     )
 
     try:
+        # Open TCP connection once, all subsequent requests share it.
+        if not modbus_client.open():
+            raise RuntimeError(
+                f'Failed to connect to {args.modbus_ip}:{args.modbus_port}'
+            )
+
         print(
             f'Got initial production rate in %: '
             f'{_read_production_rate(modbus_client=modbus_client)}'
@@ -96,21 +115,45 @@ def main() -> None:
 
         print('Writing new production rate...')
 
-        # Write production rate holding register, address is 1002. Convert
-        # generated float value with pyModbusTCP utils.
+        # Convert generated float value to two registers.
+        production_rate_data: list[int] = list(
+            TWO_REGISTERS.unpack(FLOAT32.pack(random_production_rate))
+        )
+
+        # Write production rate holding register, address is 1002.
         modbus_client.write_multiple_registers(
-            regs_addr=PRODUCTION_RATE_HOLDING,
-            regs_value=utils.long_list_to_word(
-                val_list=[utils.encode_ieee(val_float=random_production_rate)]
-            )
+            regs_addr=PRODUCTION_RATE_HOLDING, regs_value=production_rate_data
         )
 
-        time.sleep(REGISTER_WRITE_TIMEOUT)
+        # Poll production rate holding register until it reflects written
+        # value instead of waiting for the whole write timeout. The last
+        # polled value is reported, so it's read again only on timeout.
+        wait_until: float = time.monotonic() + REGISTER_WRITE_TIMEOUT
 
-        print(
-            f'Got updated production rate in %: '
-            f'{_read_production_rate(modbus_client=modbus_client)}'
-        )
+        updated_production_rate: float
+
+        while time.monotonic() < wait_until:
+            if (
+                raw_production_rate_data := (
+                    modbus_client.read_holding_registers(
+                        reg_addr=PRODUCTION_RATE_HOLDING, reg_nb=2
+                    )
+                )
+            ) == production_rate_data:
+                updated_production_rate = _decode_production_rate(
+                    raw_data=raw_production_rate_data
+                )
+
+                break
+
+            time.sleep(REGISTER_WRITE_CHECK_TIMEOUT)
+
+        else:
+            updated_production_rate = _read_production_rate(
+                modbus_client=modbus_client
+            )
+
+        print(f'Got updated production rate in %: {updated_production_rate}')
 
     except Exception as e:
         # If something went wrong, we can access Modbus error/exception info.
@@ -123,6 +166,9 @@ def main() -> None:
 
         raise
 
+    finally:
+        modbus_client.close()
+
 
 if __name__ == '__main__':
     main()
@@ -37,6 +37,15 @@ MIN_PYTHON_VERSION: Final[tuple[int, int]] = (3, 10)
 REBOOT_HOLDING: Final[int] = 4
 STATE_INPUT: Final[int] = 1200
 
+# Timeout (seconds) to complete electrolyser reboot
+REBOOT_TIMEOUT: Final[int] = 300
+
+# Initial timeout (seconds) between checks while waiting for Modbus
+# initialization, multiplied by factor after each check up to max timeout
+MODBUS_CHECK_INITIAL_TIMEOUT: Final[float] = 0.2
+MODBUS_CHECK_TIMEOUT_FACTOR: Final[float] = 1.5
+MODBUS_CHECK_MAX_TIMEOUT: Final[float] = 5
+
 
 class State(IntEnum):
     """
@@ -93,6 +102,12 @@ def main() -> None:
     )
 
     try:
+        # Open TCP connection once, all subsequent requests share it.
+        if not modbus_client.open():
+            raise RuntimeError(
+                f'Failed to connect to {args.modbus_ip}:{args.modbus_port}'
+            )
+
         # Write reboot holding register, address is 4. Register type is
         # boolean, technically it's similar to uint16.
         modbus_client.write_single_register(
@@ -101,11 +116,16 @@ def main() -> None:
 
         print('Rebooting...')
 
+        wait_until: float = time.monotonic() + REBOOT_TIMEOUT
+
+        check_timeout: float = MODBUS_CHECK_INITIAL_TIMEOUT
+
         # Reading electrolyser state input register, address is 1200. Register
         # type is enum16, technically it's similar to uint16, so number of
         # registers to read is 16 / 16 = 1. Result is None if Modbus is not
         # ready (client generates connection error, reading function returns
-        # None).
+        # None). Modbus may be ready quickly, so it's checked more often at
+        # the beginning.
         while (
             (
                 state_raw_data := modbus_client.read_input_registers(
@@ -113,9 +133,20 @@ def main() -> None:
                 )
             ) is None
         ):
+            if time.monotonic() >= wait_until:
+                raise RuntimeError(
+                    f'Modbus is not initialized after {REBOOT_TIMEOUT}'
+                    f' seconds'
+                )
+
             print('Waiting for Modbus initialization...')
 
-            time.sleep(1)
+            time.sleep(check_timeout)
+
+            check_timeout = min(
+                check_timeout * MODBUS_CHECK_TIMEOUT_FACTOR,
+                MODBUS_CHECK_MAX_TIMEOUT
+            )
 
         print(
             f'Got electrolyser state {State(state_raw_data[0]).name} '
@@ -133,6 +164,9 @@ def main() -> None:
 
         raise
 
+    finally:
+        modbus_client.close()
+
 
 if __name__ == '__main__':
     main()
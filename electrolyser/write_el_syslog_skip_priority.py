@@ -12,14 +12,15 @@
 
 import argparse
 import random
+import struct
 import sys
 import time
 
 from enum import IntEnum
-from typing import Any, Final, Optional, Self
+from typing import Any, Callable, Final, Optional, Self
 
 try:
-    from pyModbusTCP import client, utils
+    from pyModbusTCP import client
 
 except ImportError:
     print(
@@ -34,9 +35,35 @@ except ImportError:
 # Supported Python version
 MIN_PYTHON_VERSION: Final[tuple[int, int]] = (3, 10)
 
-# Timeout after writing to somehow guarantee that value is updated
+# Formats to convert int32 value to/from two big-endian 16 bits registers
+TWO_REGISTERS: Final[struct.Struct] = struct.Struct('>2H')
+INT32: Final[struct.Struct] = struct.Struct('>i')
+
+# Timeout (seconds) after writing to guarantee that value is updated, max one
+# if written value is polled
 REGISTER_WRITE_TIMEOUT: Final[int] = 2
 
+# Timeout (seconds) to check if written value is applied
+REGISTER_WRITE_CHECK_TIMEOUT: Final[float] = 0.1
+
+# Number of attempts to read registers before giving up
+READ_ATTEMPTS: Final[int] = 3
+
+# Delay (seconds) before the second reading attempt, doubled for each next one
+READ_RETRY_DELAY: Final[float] = 0.05
+
+# Timeout (seconds) to wait for Modbus response. It's shorter than client
+# default (30 seconds), since failed reads are retried.
+MODBUS_TIMEOUT: Final[float] = 5
+
+
+class ModbusReadException(RuntimeError):
+    """
+    Custom exception to indicate runtime problems reading modbus registers.
+    """
+
+    pass
+
 
 class ModbusWriteException(RuntimeError):
     """
@@ -67,6 +94,12 @@ class Inputs(IntEnum):
     CONFIGURATION_INVALIDATED_HOLDING = 4004
 
 
+# Offset of Configuration-InvalidatedHolding in 4002..4004 input registers
+INVALIDATED_HOLDING_OFFSET: Final[int] = (
+    Inputs.CONFIGURATION_INVALIDATED_HOLDING - Inputs.CONFIGURATION_LAST_RESULT
+)
+
+
 class LogSkipPriority(IntEnum):
     """
     Enum values for Log_SyslogSkipPriority holding register (4042).
@@ -92,16 +125,11 @@ class LogSkipPriority(IntEnum):
         List enum values without UNKNOWN with possibility to exclude specific
         values.
         """
-        values_: list[LogSkipPriority] = list(cls)
-
-        values_.remove(cls.UNKNOWN)
+        excluded_values: set[Self] = set(exclude_values or ())
 
-        if exclude_values is not None:
-            for value in exclude_values:
-                if value is not cls.UNKNOWN:
-                    values_.remove(value)
+        excluded_values.add(cls.UNKNOWN)
 
-        return values_
+        return [value for value in cls if value not in excluded_values]
 
 
 class ConfigurationLastResult(IntEnum):
@@ -125,46 +153,143 @@ class ConfigurationLastResult(IntEnum):
         return cls.UNKNOWN
 
 
+def _wait_registers_values(
+    read_registers: Callable[..., Optional[list[int]]], address: int,
+    values: list[int]
+) -> None:
+    """
+    Poll registers until they reflect expected values or write timeout is
+    expired. Result is not checked here, it's validated by further reads.
+    """
+    wait_until: float = time.monotonic() + REGISTER_WRITE_TIMEOUT
+
+    while time.monotonic() < wait_until:
+        if read_registers(reg_addr=address, reg_nb=len(values)) == values:
+            break
+
+        # Don't sleep past the deadline, monotonic clock is not affected by
+        # system clock changes.
+        remaining_timeout: float = max(wait_until - time.monotonic(), 0)
+
+        time.sleep(min(REGISTER_WRITE_CHECK_TIMEOUT, remaining_timeout))
+
+
 def _write_single_register(
-    modbus_client: client.ModbusClient, address: int, value: int
+    modbus_client: client.ModbusClient, address: int, value: int,
+    verify: tuple[Inputs, int]
 ) -> None:
     """
-    Write 16 bits register.
+    Write 16 bits register and wait until input register reflects the
+    result with expected value.
     """
-    modbus_client.write_single_register(reg_addr=address, reg_value=value)
+    if not modbus_client.write_single_register(
+        reg_addr=address, reg_value=value
+    ):
+        raise ModbusWriteException(
+            f'Failed to write value {value} to holding register at address'
+            f' {address}'
+        )
 
-    time.sleep(REGISTER_WRITE_TIMEOUT)
+    _wait_registers_values(
+        read_registers=modbus_client.read_input_registers,
+        address=verify[0], values=[verify[1]]
+    )
 
 
 def _write_multiple_registers(
     modbus_client: client.ModbusClient, address: int, values: list[int]
 ) -> None:
     """
-    Write over 16 bits register.
+    Write over 16 bits register. There is no status register reflecting that
+    written value is applied (holding register reads back written value
+    immediately), so wait for write timeout before checking configuration
+    result.
     """
-    modbus_client.write_multiple_registers(
+    if not modbus_client.write_multiple_registers(
         regs_addr=address, regs_value=values
-    )
+    ):
+        raise ModbusWriteException(
+            f'Failed to write values {values} to holding registers at address'
+            f' {address}'
+        )
 
     time.sleep(REGISTER_WRITE_TIMEOUT)
 
 
+def _read_with_retries(
+    read_registers: Callable[..., Optional[list[int]]], address: int,
+    count: int
+) -> Optional[list[int]]:
+    """
+    Read registers with exponential backoff between attempts, so transient
+    connection problems don't abort configuration. Reading is idempotent, so
+    it's safe to repeat. Writes are not retried, configuration is rolled back
+    instead.
+    """
+    for attempt in range(READ_ATTEMPTS):
+        if attempt:
+            time.sleep(READ_RETRY_DELAY * 2 ** (attempt - 1))
+
+        if (
+            raw_data := read_registers(reg_addr=address, reg_nb=count)
+        ) is not None:
+            return raw_data
+
+    return None
+
+
 def _read_input_registers(
     modbus_client: client.ModbusClient, address: int, count: int
 ) -> list[int]:
     """
-    Read input registers.
+    Read input registers. Reading function returns None on failure, so result
+    is checked before it gets to decoding.
     """
-    return modbus_client.read_input_registers(reg_addr=address, reg_nb=count)
+    if (
+        raw_data := _read_with_retries(
+            read_registers=modbus_client.read_input_registers,
+            address=address, count=count
+        )
+    ) is None:
+        raise ModbusReadException(
+            f'Failed to read {count} input register(s) at address {address}'
+        )
+
+    return raw_data
 
 
 def _read_holding_registers(
     modbus_client: client.ModbusClient, address: int, count: int
 ) -> list[int]:
     """
-    Read holding registers.
+    Read holding registers. Reading function returns None on failure, so
+    result is checked before it gets to decoding.
     """
-    return modbus_client.read_holding_registers(reg_addr=address, reg_nb=count)
+    if (
+        raw_data := _read_with_retries(
+            read_registers=modbus_client.read_holding_registers,
+            address=address, count=count
+        )
+    ) is None:
+        raise ModbusReadException(
+            f'Failed to read {count} holding register(s) at address {address}'
+        )
+
+    return raw_data
+
+
+def _decode_int32(raw_data: list[int]) -> int:
+    """
+    Convert two registers to single signed int value.
+    """
+    return INT32.unpack(TWO_REGISTERS.pack(*raw_data))[0]
+
+
+def _encode_int32(value: int) -> list[int]:
+    """
+    Convert single signed int value to two registers.
+    """
+    return list(TWO_REGISTERS.unpack(INT32.pack(value)))
 
 
 def _read_syslog_skip_priority(
@@ -173,17 +298,15 @@ def _read_syslog_skip_priority(
     """
     Read system logs priority holding register, address is 4042. Register type
     is int32, so number of registers to read is 32 / 16 = 2. Convert raw
-    response to single int value with pyModbusTCP utils.
+    response to single int value.
     """
     return LogSkipPriority(
-        utils.get_list_2comp(
-            val_list=utils.word_list_to_long(
-                val_list=_read_holding_registers(
-                    modbus_client=modbus_client,
-                    address=Holdings.LOG_SKIP_PRIORITY.value, count=2
-                )
-            ), val_size=32
-        )[0]
+        _decode_int32(
+            raw_data=_read_holding_registers(
+                modbus_client=modbus_client,
+                address=Holdings.LOG_SKIP_PRIORITY, count=2
+            )
+        )
     )
 
 
@@ -213,10 +336,16 @@ def main() -> None:
     args: argparse.Namespace = parse_args()
 
     modbus_client: client.ModbusClient = client.ModbusClient(
-        host=args.modbus_ip, port=args.modbus_port
+        host=args.modbus_ip, port=args.modbus_port, timeout=MODBUS_TIMEOUT
     )
 
     try:
+        # Open TCP connection once, all subsequent requests share it.
+        if not modbus_client.open():
+            raise RuntimeError(
+                f'Failed to connect to {args.modbus_ip}:{args.modbus_port}'
+            )
+
         initial_syslog_skip_priority: LogSkipPriority = (
             _read_syslog_skip_priority(modbus_client=modbus_client)
         )
@@ -234,7 +363,7 @@ def main() -> None:
         if bool(
             _read_input_registers(
                 modbus_client=modbus_client,
-                address=Inputs.CONFIGURATION_IN_PROGRESS.value, count=1
+                address=Inputs.CONFIGURATION_IN_PROGRESS, count=1
             )[0]
         ):
             raise ModbusWriteException(
@@ -248,7 +377,8 @@ def main() -> None:
             # Register type is boolean, technically it's similar to uint16.
             _write_single_register(
                 modbus_client=modbus_client,
-                address=Holdings.CONFIGURATION_BEGIN.value, value=1
+                address=Holdings.CONFIGURATION_BEGIN, value=1,
+                verify=(Inputs.CONFIGURATION_IN_PROGRESS, 1)
             )
 
             print('Check configuration source...')
@@ -259,7 +389,7 @@ def main() -> None:
             if not bool(
                 _read_input_registers(
                     modbus_client=modbus_client,
-                    address=Inputs.CONFIGURATION_OVER_MODBUS.value, count=1
+                    address=Inputs.CONFIGURATION_OVER_MODBUS, count=1
                 )[0]
             ):
                 raise ModbusWriteException(
@@ -278,49 +408,38 @@ def main() -> None:
             # Register type is int32, so technically we can write any supported
             # value. Values less than 0 are considered as DISABLE_LOGGING,
             # values great than 6 are considered as ALL_MESSAGES. Convert
-            # generated value with pyModbusTCP utils.
+            # generated value to two registers.
             _write_multiple_registers(
                 modbus_client=modbus_client,
-                address=Holdings.LOG_SKIP_PRIORITY.value,
-                values=utils.long_list_to_word(
-                    val_list=[
-                        utils.get_2comp(
-                            val_int=new_syslog_skip_priority.value, val_size=32
-                        )
-                    ]
-                )
+                address=Holdings.LOG_SKIP_PRIORITY,
+                values=_encode_int32(value=new_syslog_skip_priority.value)
             )
 
             print('Check configuration last result...')
 
-            # Read Configuration-LastResult input register, address is 4002.
-            # Register type is int32, so number of registers to read is
-            # 32 / 16 = 2. Convert raw response to single int value with
-            # pyModbusTCP utils.
+            # Read Configuration-LastResult input register, address is 4002,
+            # together with Configuration-InvalidatedHolding input register,
+            # address is 4004. Last result register type is int32, so number
+            # of registers to read is 32 / 16 = 2. Invalidated holding is read
+            # as 16 / 16 = 1 register. Both values are read with a single
+            # request covering 4002..4004 range, so number of registers to
+            # read is 4004 - 4002 + 1 = 3.
+            raw_configuration_result: list[int] = _read_input_registers(
+                modbus_client=modbus_client,
+                address=Inputs.CONFIGURATION_LAST_RESULT,
+                count=INVALIDATED_HOLDING_OFFSET + 1
+            )
+
+            # Convert raw last result data to single int value.
             configuration_last_result: ConfigurationLastResult = (
                 ConfigurationLastResult(
-                    utils.get_list_2comp(
-                        val_list=utils.word_list_to_long(
-                            val_list=_read_input_registers(
-                                modbus_client=modbus_client,
-                                address=Inputs.CONFIGURATION_LAST_RESULT.value,
-                                count=2
-                            )
-                        ), val_size=32
-                    )[0]
+                    _decode_int32(raw_data=raw_configuration_result[:2])
                 )
             )
 
             if configuration_last_result != ConfigurationLastResult.OK:
-                # Read Configuration-InvalidatedHolding input register, address
-                # is 4004. Register type is uint32, so number of registers to
-                # read is 16 / 16 = 1.
                 configuration_invalidated_holding: int = (
-                    _read_input_registers(
-                        modbus_client=modbus_client,
-                        address=Inputs.CONFIGURATION_INVALIDATED_HOLDING.value,
-                        count=1
-                    )[0]
+                    raw_configuration_result[INVALIDATED_HOLDING_OFFSET]
                 )
 
                 raise ModbusWriteException(
@@ -336,10 +455,11 @@ def main() -> None:
             # We must write 1 to commit configuration.
             _write_single_register(
                 modbus_client=modbus_client,
-                address=Holdings.CONFIGURATION_COMMIT.value, value=1
+                address=Holdings.CONFIGURATION_COMMIT, value=1,
+                verify=(Inputs.CONFIGURATION_IN_PROGRESS, 0)
             )
 
-        except ModbusWriteException:
+        except (ModbusReadException, ModbusWriteException):
             print('Rollback configuration...')
 
             # Write Configuration-Commit holding register, address is 4001.
@@ -347,7 +467,8 @@ def main() -> None:
             # We must write 0 to rollback configuration.
             _write_single_register(
                 modbus_client=modbus_client,
-                address=Holdings.CONFIGURATION_COMMIT.value, value=0
+                address=Holdings.CONFIGURATION_COMMIT, value=0,
+                verify=(Inputs.CONFIGURATION_IN_PROGRESS, 0)
             )
 
             raise
@@ -364,14 +485,17 @@ def main() -> None:
     except Exception as e:
         # If something went wrong, we can access Modbus error/exception info.
         # For example, in case of connection problems, reading register will
-        # return None and script will fail with error while data converting,
-        # but real problem description will be stored in client.
+        # return None and script will fail with ModbusReadException, but real
+        # problem description will be stored in client.
         print(f'Exception occurred: {e}')
         print(f'Modbus error: {modbus_client.last_error_as_txt}')
         print(f'Modbus exception: {modbus_client.last_except_as_txt}')
 
         raise
 
+    finally:
+        modbus_client.close()
+
 
 if __name__ == '__main__':
     main()